@@ -41,21 +41,28 @@ from stability_sdk.utils import (
 logger = logging.getLogger(__name__)
 logger.setLevel(level=logging.INFO)
 
-def image_to_prompt(im, init: bool = False, mask: bool = False) -> generation.Prompt:
+def image_to_prompt(
+    im: Union[Image.Image, bytes], init: bool = False, mask: bool = False
+) -> generation.Prompt:
     if init and mask:
         raise ValueError("init and mask cannot both be True")
-    buf = io.BytesIO()
-    im.save(buf, format="PNG")
-    buf.seek(0)
+    if isinstance(im, bytes):
+        # already-encoded image, pass through without re-encoding
+        binary = im
+    else:
+        buf = io.BytesIO()
+        # upload-only intermediate, favour encode speed over file size
+        im.save(buf, format="PNG", compress_level=1)
+        binary = buf.getvalue()
     if mask:
         return generation.Prompt(
             artifact=generation.Artifact(
-                type=generation.ARTIFACT_MASK, binary=buf.getvalue()
+                type=generation.ARTIFACT_MASK, binary=binary
             )
         )
     return generation.Prompt(
         artifact=generation.Artifact(
-            type=generation.ARTIFACT_IMAGE, binary=buf.getvalue()
+            type=generation.ARTIFACT_IMAGE, binary=binary
         ),
         parameters=generation.PromptParameters(init=init),
     )
@@ -167,8 +174,8 @@ class StabilityInference:
     def generate(
         self,
         prompt: Union[str, List[str], generation.Prompt, List[generation.Prompt]],
-        init_image: Optional[Image.Image] = None,
-        mask_image: Optional[Image.Image] = None,
+        init_image: Optional[Union[Image.Image, bytes]] = None,
+        mask_image: Optional[Union[Image.Image, bytes]] = None,
         height: int = 512,
         width: int = 512,
         start_schedule: float = 1.0,
@@ -190,8 +197,8 @@ class StabilityInference:
         Generate images from a prompt.
 
         :param prompt: Prompt to generate images from.
-        :param init_image: Init image.
-        :param mask_image: Mask image
+        :param init_image: Init image, as a PIL image or already-encoded image bytes.
+        :param mask_image: Mask image, as a PIL image or already-encoded image bytes.
         :param height: Height of the generated images.
         :param width: Width of the generated images.
         :param start_schedule: Start schedule for init image.
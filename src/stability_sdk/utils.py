@@ -4,8 +4,10 @@ import os
 import uuid
 import random
 import io
+import functools
 import logging
 import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Generator, List, Optional, Union, Any, Sequence, Tuple
 import mimetypes
 
@@ -57,14 +59,24 @@ def truncate_fit(prefix: str, prompt: str, ext: str, ts: int, idx: int, max: int
     NB: As implemented, 'max' is the smallest filename length that will trigger truncation.
     It is presumed that the sum of the lengths of the other filename fields is smaller than `max`.
     If they exceed `max`, this function will just always construct a filename with no prompt component.
+    Lengths are measured in UTF-8 bytes, and the prompt is never cut mid-character.
+    Characters that are not valid UTF-8 (lone surrogates, e.g. from non-UTF-8 command line
+    bytes or a split emoji pair) are dropped from the prompt.
     """
     post = f"_{ts}_{idx}"
     prompt_budget = max
-    prompt_budget -= len(prefix)
+    prompt_budget -= len(prefix.encode("utf-8", errors="surrogatepass"))
     prompt_budget -= len(post)
-    prompt_budget -= len(ext) + 1
-    return f"{prefix}{prompt[:prompt_budget]}{post}{ext}"
+    prompt_budget -= len(ext.encode("utf-8", errors="surrogatepass")) + 1
+    if prompt_budget < 0:
+        prompt_budget = 0
+    # surrogatepass: lone surrogates (e.g. non-UTF-8 argv bytes, split emoji pairs) count
+    # toward the budget and are then dropped by the decode below
+    prompt = prompt.encode("utf-8", errors="surrogatepass")[:prompt_budget]
+    prompt = prompt.decode("utf-8", errors="ignore")
+    return f"{prefix}{prompt}{post}{ext}"
 
+@functools.lru_cache(maxsize=32)
 def get_sampler_from_str(s: str) -> generation.DiffusionSampler:
     """
     Convert a string to a DiffusionSampler enum.
@@ -77,6 +89,21 @@ def get_sampler_from_str(s: str) -> generation.DiffusionSampler:
         raise ValueError(f"unknown sampler {s}")
     return algorithm
 
+def _show_image(path: str, binary: bytes, verbose: bool = False):
+    """
+    Decode and display an encoded image, logging rather than raising on failure.
+    :param path: The filename associated with the image, used for logging.
+    :param binary: The encoded image bytes.
+    :param verbose: Whether to log the image being opened.
+    """
+    if verbose:
+        logger.info(f"opening {path}")
+    try:
+        img = Image.open(io.BytesIO(binary))
+        img.show()
+    except Exception:
+        logger.exception(f"failed to open {path}")
+
 def open_images(
     images: Union[
         Sequence[Tuple[str, generation.Artifact]],
@@ -86,14 +113,17 @@ def open_images(
 ) -> Generator[Tuple[str, generation.Artifact], None, None]:
     """
     Open the images from the filenames and Artifacts tuples.
+    Images are decoded and shown on a background thread so that launching
+    the viewer does not block the generator; with `verbose`, log messages
+    are emitted from that thread. Decode and viewer failures are logged rather
+    than raised. On exit, including an early `break`, the generator blocks until
+    pending viewers have launched.
     :param images: The tuples of Artifacts and associated images to open.
     :return:  A Generator of tuples of image filenames and Artifacts, intended
      for passthrough.
     """
-    for path, artifact in images:
-        if artifact.type == generation.ARTIFACT_IMAGE:
-            if verbose:
-                logger.info(f"opening {path}")
-            img = Image.open(io.BytesIO(artifact.binary))
-            img.show()
-        yield (path, artifact)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        for path, artifact in images:
+            if artifact.type == generation.ARTIFACT_IMAGE:
+                executor.submit(_show_image, path, artifact.binary, verbose)
+            yield (path, artifact)
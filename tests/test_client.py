@@ -1,3 +1,4 @@
+import io
 import pytest
 from PIL import Image
 
@@ -46,6 +47,14 @@ def test_image_to_prompt_mask():
     prompt = client.image_to_prompt(im, init=False, mask=True)
     assert isinstance(prompt, generation.Prompt)
 
+def test_image_to_prompt_bytes():
+    im = Image.new('RGB',(1,1))
+    buf = io.BytesIO()
+    im.save(buf, format='PNG')
+    prompt = client.image_to_prompt(buf.getvalue(), init=True, mask=False)
+    assert isinstance(prompt, generation.Prompt)
+    assert prompt.artifact.binary == buf.getvalue()
+
 def test_image_to_prompt_init_mask():
     im = Image.new('RGB',(1,1))
     try:
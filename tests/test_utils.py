@@ -1,10 +1,16 @@
+import io
+import logging
+
 import pytest
+from PIL import Image
+
 import stability_sdk.interfaces.gooseai.generation.generation_pb2 as generation
 
 from stability_sdk.utils import (
     SAMPLERS,
     artifact_type_to_str,
     get_sampler_from_str,
+    open_images,
     truncate_fit,
 )
 
@@ -26,6 +32,11 @@ def test_get_sampler_from_str_invalid():
     with pytest.raises(ValueError, match="unknown sampler"):
         get_sampler_from_str(s='not a real sampler')
 
+def test_get_sampler_from_str_cached():
+    get_sampler_from_str.cache_clear()
+    assert get_sampler_from_str(s='k_lms') == get_sampler_from_str(s='k_lms')
+    assert get_sampler_from_str.cache_info().hits == 1
+
 
 ####################################
 # to do: pytest.mark.paramaterized #
@@ -50,3 +61,62 @@ def test_truncate_fit1():
         max=22)
     assert outv == 'foo_ba_12345678_0.baz'
  
+
+def test_truncate_fit_multibyte():
+    outv = truncate_fit(
+        prefix='foo_', 
+        prompt='héllo', 
+        ext='.baz', 
+        ts=12345678,
+        idx=0, 
+        max=22)
+    assert outv == 'foo_h_12345678_0.baz'
+
+def test_truncate_fit_surrogate():
+    outv = truncate_fit(
+        prefix='foo_', 
+        prompt='ab\udcffcd', 
+        ext='.png', 
+        ts=1,
+        idx=0, 
+        max=200)
+    assert outv == 'foo_abcd_1_0.png'
+
+def test_truncate_fit_high_surrogate():
+    outv = truncate_fit(
+        prefix='foo_', 
+        prompt='a\ud83d b', 
+        ext='.png', 
+        ts=1,
+        idx=0, 
+        max=200)
+    assert outv == 'foo_a b_1_0.png'
+
+def test_truncate_fit_over_budget():
+    outv = truncate_fit(
+        prefix='foo_', 
+        prompt='bar', 
+        ext='.baz', 
+        ts=12345678,
+        idx=0, 
+        max=19)
+    assert outv == 'foo__12345678_0.baz'
+
+def test_open_images(monkeypatch, caplog):
+    shown = []
+    monkeypatch.setattr(Image.Image, "show", lambda self: shown.append(self.size))
+
+    buf = io.BytesIO()
+    Image.new('RGB', (2, 3)).save(buf, format='PNG')
+    images = [
+        ('a.png', generation.Artifact(type=generation.ARTIFACT_IMAGE, binary=buf.getvalue())),
+        ('b.pb.json', generation.Artifact(type=generation.ARTIFACT_TEXT, text='foo')),
+        ('c.png', generation.Artifact(type=generation.ARTIFACT_IMAGE, binary=b'not an image')),
+        ('d.png', generation.Artifact(type=generation.ARTIFACT_IMAGE, binary=buf.getvalue())),
+    ]
+    with caplog.at_level(logging.ERROR):
+        outv = list(open_images(images))
+
+    assert outv == images
+    assert shown == [(2, 3), (2, 3)]
+    assert "failed to open c.png" in caplog.text